@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -7,8 +10,23 @@ load_dotenv(Path(__file__).resolve().parents[1] / ".env")
 
 from .routers.clearview import router as clearview_router
 from .routers.audio import router as audio_router
+from .services import analysis_service, audio_service, clearview_service, extractor_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Not awaited: startup should not wait on spawning a PDF worker.
+    warm_up = asyncio.create_task(clearview_service.warm_up())
+    yield
+    warm_up.cancel()
+    await analysis_service.close_client()
+    await audio_service.close_client()
+    await extractor_service.close_http_client()
+    analysis_service.shut_down()
+    clearview_service.shut_down()
+
 
-app = FastAPI(title="Clearway API")
+app = FastAPI(title="Clearway API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
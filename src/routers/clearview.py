@@ -1,17 +1,25 @@
-import asyncio
-import base64
+import binascii
 import logging
+import os
 
 from fastapi import APIRouter, HTTPException, status
 
 from ..models.models import ClearviewResponse, InputRequest
 from ..services.extractor_service import extract
 from ..services.analysis_service import analyze, AnalysisResult
-from ..services.clearview_service import generate_clearview
+from ..services.clearview_service import render_clearview
+from ..services.cache_service import LRUCache, content_digest
 
 router = APIRouter(tags=["Clearview"])
 logger = logging.getLogger(__name__)
 
+# Full responses keyed by input digest. A URL input is cached as-is, so this
+# TTL, not the extractor's URL cache, bounds how stale a changed article can
+# be served; the default matches that cache (5 minutes).
+# CLEARVIEW_CACHE_TTL=0 disables the cache.
+_RESPONSE_TTL = float(os.environ.get("CLEARVIEW_CACHE_TTL", "300"))
+_RESPONSE_CACHE = LRUCache(maxsize=256, ttl=_RESPONSE_TTL)
+
 
 # ─────────────────────────────────────────────
 # POST /clearview
@@ -20,6 +28,12 @@ logger = logging.getLogger(__name__)
 
 @router.post("/clearview", response_model=ClearviewResponse)
 async def clearview_route(request: InputRequest) -> ClearviewResponse:
+    # 0. Repeat input → cached response
+    cache_key = content_digest(request.input.strip())
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # 1. Extract
     try:
         extraction = await extract(request.input)
@@ -55,8 +69,7 @@ async def clearview_route(request: InputRequest) -> ClearviewResponse:
 
     # 4. Generate PDF
     try:
-        pdf_bytes = await asyncio.to_thread(
-            generate_clearview,
+        pdf_bytes = await render_clearview(
             extraction.title,
             extraction.content,
             extraction.source,
@@ -78,7 +91,7 @@ async def clearview_route(request: InputRequest) -> ClearviewResponse:
         if result.ai_sections else None
     )
 
-    return ClearviewResponse(
+    response = ClearviewResponse(
         title=title,
         content=extraction.content,
         source=extraction.source,
@@ -91,6 +104,12 @@ async def clearview_route(request: InputRequest) -> ClearviewResponse:
         is_subjective=result.is_subjective,
         biases=result.biases,
         ai_section=ai_section,
-        pdf=base64.b64encode(pdf_bytes).decode(),
+        pdf=binascii.b2a_base64(pdf_bytes, newline=False).decode("ascii"),
         error=None,
     )
+
+    # Only cache full AI analyses; a heuristic fallback (e.g. OpenAI briefly
+    # unavailable) should not be pinned for the whole TTL.
+    if _RESPONSE_TTL > 0 and result.ai_sections:
+        _RESPONSE_CACHE.set(cache_key, response)
+    return response
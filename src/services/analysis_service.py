@@ -2,15 +2,21 @@
 Unified analysis service — summarization, scam detection, objectivity, and bias
 in a single module with one OpenAI call and pure-Python fallbacks.
 """
+import asyncio
 import heapq
 import logging
 import os
 import re
+from operator import itemgetter
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 
-from openai import APIError, AsyncOpenAI, AuthenticationError, RateLimitError
+import ahocorasick
+from openai import AsyncOpenAI, AuthenticationError, RateLimitError
+
+from .cache_service import LRUCache, content_digest
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +26,34 @@ logger = logging.getLogger(__name__)
 
 _MODEL = "gpt-4o-mini"
 
+# Upper bound on in-flight OpenAI requests per worker process.
+_MAX_CONCURRENT_REQUESTS = max(1, int(os.environ.get("OPENAI_MAX_CONCURRENCY", "8")))
+# The SDK retries 429/5xx/connection errors with jittered exponential
+# backoff and honours Retry-After; the timeout applies per attempt.
+_MAX_RETRIES     = 3
+_REQUEST_TIMEOUT = 60.0
+
 # Backup-only: only conclude when score is clearly high/low.
 # Anything between these triggers a "dubious" message.
 _HIGH = 0.70
 _LOW  = 0.20
 
+# Short inputs with no scam or bias keyword, link or money amount, and
+# scam/subjectivity scores at or below the shortcut threshold, ask OpenAI
+# for the summary only; the backup messages give the verdicts. Off by
+# default (OPENAI_SHORTCUT_MAX_CHARS=0), so every input gets the full analysis.
+_SHORTCUT_MAX_CHARS = int(os.environ.get("OPENAI_SHORTCUT_MAX_CHARS", "0"))
+_SHORTCUT_MAX_SCORE = min(float(os.environ.get("OPENAI_SHORTCUT_MAX_SCORE", str(_LOW))), _LOW)
+
+# Heuristic scores keyed by content digest; parsed OpenAI sections and
+# extractive summaries keyed by (content digest, sentence count).
+_SCORE_CACHE   = LRUCache(maxsize=4096)
+_AI_CACHE      = LRUCache(maxsize=1024)
+_SUMMARY_CACHE = LRUCache(maxsize=1024)
+
+# OpenAI calls currently in flight, keyed like _AI_CACHE.
+_AI_INFLIGHT: dict[tuple[bytes, int], "asyncio.Future[dict[str, str]]"] = {}
+
 # ─────────────────────────────────────────────────────────────
 # Section tags (used in the OpenAI prompt and response parsing)
 # ─────────────────────────────────────────────────────────────
@@ -46,7 +75,7 @@ _TAG_DISPLAY = {
 # Keyword lists
 # ─────────────────────────────────────────────────────────────
 
-_STOP_WORDS = {
+_STOP_WORDS = frozenset({
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
     "being", "have", "has", "had", "do", "does", "did", "will", "would",
@@ -54,7 +83,7 @@ _STOP_WORDS = {
     "that", "these", "those", "i", "you", "he", "she", "we", "they",
     "not", "as", "if", "so", "than", "then", "when", "where", "which",
     "who", "what", "how", "all", "also", "just", "more", "their", "there",
-}
+})
 
 _SCAM_CATEGORIES: list[tuple[set[str], float]] = [
     # Urgency
@@ -85,26 +114,31 @@ _SCAM_CATEGORIES: list[tuple[set[str], float]] = [
       "verify your identity", "submit your information"}, 1.5),
 ]
 _SCAM_TOTAL_WEIGHT = sum(w for _, w in _SCAM_CATEGORIES)
+# Keyword categories plus the caps (0.5) and exclamation (0.5) terms.
+_SCAM_MAX_SCORE = _SCAM_TOTAL_WEIGHT + 1.0
 
-_SUBJECTIVE_PHRASES = {
+_SUBJECTIVE_PHRASES = frozenset({
     "i think", "i believe", "i feel", "i consider",
     "in my opinion", "in my view", "personally", "from my perspective",
     "it seems to me", "clearly", "obviously", "undoubtedly",
     "it is clear that", "arguably", "perhaps", "probably",
-}
-_OBJECTIVE_PHRASES = {
+})
+_OBJECTIVE_PHRASES = frozenset({
     "according to", "research shows", "studies show", "study found",
     "data indicates", "evidence suggests", "researchers found",
     "experts say", "reported that", "published in", "peer-reviewed",
     "analysis shows", "survey found", "census data",
-}
-_EMOTIONAL_WORDS = {
+})
+_EMOTIONAL_WORDS = frozenset({
     "outrageous", "shocking", "horrifying", "disgusting", "appalling",
     "wonderful", "amazing", "fantastic", "incredible", "terrible",
     "awful", "devastating", "catastrophic", "brilliant", "pathetic",
     "despicable", "monstrous", "atrocious", "infuriating",
-}
-_FIRST_PERSON = {"i", "we", "my", "our", "me", "us", "myself"}
+})
+_FIRST_PERSON = frozenset({"i", "we", "my", "our", "me", "us", "myself"})
+# Disjoint union of the two word lexicons: most tokens miss both, and this
+# lets them be skipped with a single lookup.
+_SUBJECTIVE_WORDS = _FIRST_PERSON | _EMOTIONAL_WORDS
 
 _BIAS_CATEGORIES: dict[str, set[str]] = {
     "political bias": {
@@ -135,6 +169,68 @@ _BIAS_CATEGORIES: dict[str, set[str]] = {
 }
 _BIAS_SATURATION = 3
 
+_WORD_RE       = re.compile(r"\b\w+\b")
+# Links and money amounts: the payload of most SMS-style scams, even ones
+# that use none of the keyword signals (e.g. a fake redelivery fee).
+_LINK_OR_MONEY_RE = re.compile(r"https?://|www\.|\b[a-z0-9-]+\.[a-z]{2,}\b|[$£€]\s?\d")
+_ALPHA_WORD_RE = re.compile(r"\b[A-Za-z]+\b")
+
+# ─────────────────────────────────────────────────────────────
+# Keyword automata (built once at import, one pass per request)
+# ─────────────────────────────────────────────────────────────
+
+def _build_automaton(signal_bits: dict[str, int]) -> ahocorasick.Automaton:
+    """Automaton mapping each signal to (bit, length)."""
+    automaton = ahocorasick.Automaton()
+    for signal, bit in signal_bits.items():
+        automaton.add_word(signal, (bit, len(signal)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_signal_masks(signal_sets: Iterable[set[str]]) -> tuple[dict[str, int], list[int]]:
+    """Give every signal its own bit; return signal → bit and per-category masks."""
+    bits: dict[str, int] = {}
+    masks: list[int] = []
+    for signals in signal_sets:
+        mask = 0
+        for signal in sorted(signals):
+            bits[signal] = 1 << len(bits)
+            mask |= bits[signal]
+        masks.append(mask)
+    return bits, masks
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _matched_mask(
+    automaton: ahocorasick.Automaton, text_lower: str, whole_words: bool = False
+) -> int:
+    """OR together the bits of every signal found; repeats count once.
+    With whole_words, matches that start inside a longer word (e.g. 'men are'
+    in 'women are') are ignored; suffixes are allowed so inflections such as
+    'destroyed' or 'radicals' still count."""
+    matched = 0
+    for end, (bit, length) in automaton.iter(text_lower):
+        if whole_words:
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+        matched |= bit
+    return matched
+
+
+# Signals as parallel arrays: a category's hit count is the popcount of the
+# matched-signal mask restricted to that category's bits.
+_SCAM_SIGNAL_BITS, _SCAM_CATEGORY_MASKS = _build_signal_masks(s for s, _ in _SCAM_CATEGORIES)
+_SCAM_CATEGORY_WEIGHTS = [w for _, w in _SCAM_CATEGORIES]
+_SCAM_AUTOMATON = _build_automaton(_SCAM_SIGNAL_BITS)
+
+_BIAS_SIGNAL_BITS, _BIAS_CATEGORY_MASKS = _build_signal_masks(_BIAS_CATEGORIES.values())
+_BIAS_AUTOMATON = _build_automaton(_BIAS_SIGNAL_BITS)
+
 # ─────────────────────────────────────────────────────────────
 # Result type
 # ─────────────────────────────────────────────────────────────
@@ -155,89 +251,123 @@ class AnalysisResult:
 # Heuristic scorers
 # ─────────────────────────────────────────────────────────────
 
-def _score_scam(text: str) -> float:
-    text_lower = text.lower()
+def _score_scam(text: str, matched: int) -> float:
     words = text.split()
     score = 0.0
-    for signals, weight in _SCAM_CATEGORIES:
-        hits = sum(1 for s in signals if s in text_lower)
+    for mask, weight in zip(_SCAM_CATEGORY_MASKS, _SCAM_CATEGORY_WEIGHTS):
+        hits = bin(matched & mask).count("1")
         score += min(hits / 3.0, 1.0) * weight
     if words:
         caps_ratio = sum(1 for w in words if w.isupper() and len(w) > 2) / len(words)
         score += min(caps_ratio * 5, 1.0) * 0.5
     exclaim_ratio = min(text.count("!") / max(len(words), 1) * 10, 1.0)
     score += exclaim_ratio * 0.5
-    return round(min(score / (_SCAM_TOTAL_WEIGHT + 1.0), 1.0), 4)
+    return round(score / _SCAM_MAX_SCORE, 4)
 
 
-def _score_subjectivity(text: str) -> float:
-    text_lower = text.lower()
-    words = re.findall(r"\b\w+\b", text_lower)
+def _score_subjectivity(text_lower: str, words: list[str]) -> float:
     if not words:
         return 0.5
     word_count = len(words)
     subj_hits  = sum(1 for p in _SUBJECTIVE_PHRASES if p in text_lower)
     obj_hits   = sum(1 for p in _OBJECTIVE_PHRASES  if p in text_lower)
-    fp_density  = sum(1 for w in words if w in _FIRST_PERSON) / word_count
-    emo_density = sum(1 for w in words if w in _EMOTIONAL_WORDS) / word_count
+    fp_hits = emo_hits = 0
+    for w in words:
+        if w not in _SUBJECTIVE_WORDS:
+            continue
+        if w in _FIRST_PERSON:
+            fp_hits += 1
+        else:
+            emo_hits += 1
+    fp_density  = fp_hits / word_count
+    emo_density = emo_hits / word_count
     subj_score = (
         min(subj_hits / 5.0, 1.0)              * 0.35 +
         min(fp_density * 20,  1.0)             * 0.30 +
         min(emo_density * 50, 1.0)             * 0.20 +
-        max(0.0, 1.0 - min(obj_hits / 5.0, 1.0)) * 0.15
+        (1.0 - min(obj_hits / 5.0, 1.0))       * 0.15
     )
-    return round(min(max(subj_score, 0.0), 1.0), 4)
+    # Each term is already in [0, 1] and the weights sum to 1 — no clamp needed.
+    return round(subj_score, 4)
 
 
-def _score_biases(text: str) -> dict[str, float]:
-    text_lower = text.lower()
-    words = re.findall(r"\b\w+\b", text_lower)
-    word_count = max(len(words), 1)
+def _score_biases(matched: int, words: list[str]) -> dict[str, float]:
+    length_factor = min(max(len(words), 1) / 200, 1.0)
     scores: dict[str, float] = {}
-    for category, signals in _BIAS_CATEGORIES.items():
-        hits = sum(1 for s in signals if s in text_lower)
-        length_factor = min(word_count / 200, 1.0)
+    for category, mask in zip(_BIAS_CATEGORIES, _BIAS_CATEGORY_MASKS):
+        hits = bin(matched & mask).count("1")
         scores[category] = round(min(hits / _BIAS_SATURATION, 1.0) * length_factor, 4)
-    return dict(sorted(scores.items(), key=lambda x: x[1], reverse=True))
+    return scores
+
+
+def _categories_at_least(scores: dict[str, float], threshold: float) -> list[str]:
+    """Categories scoring >= threshold, highest first (ties keep category order)."""
+    above = [(k, v) for k, v in scores.items() if v >= threshold]
+    above.sort(key=itemgetter(1), reverse=True)
+    return [k for k, _ in above]
+
+
+def _heuristic_scores(text: str) -> tuple[float, float, dict[str, float], bool]:
+    """Run all heuristic scorers. CPU-bound — call via _run_cpu.
+
+    The last element is True when any scam or bias keyword, link or money
+    amount matched."""
+    text_lower = text.lower()
+    # Lowercased word tokens, shared by the subjectivity and bias scorers.
+    words = _WORD_RE.findall(text_lower)
+    scam_matched = _matched_mask(_SCAM_AUTOMATON, text_lower)
+    bias_matched = _matched_mask(_BIAS_AUTOMATON, text_lower, whole_words=True)
+    return (
+        _score_scam(text, scam_matched),
+        _score_subjectivity(text_lower, words),
+        _score_biases(bias_matched, words),
+        bool(scam_matched or bias_matched or _LINK_OR_MONEY_RE.search(text_lower)),
+    )
 
 # ─────────────────────────────────────────────────────────────
 # Extractive summariser (fallback when OpenAI is unavailable)
 # ─────────────────────────────────────────────────────────────
 
+# Splits on line breaks and on sentence ends (terminator, optional closing
+# quote, same-line whitespace, then a capital or quote) in a single pass.
+_SENTENCE_SPLIT_RE = re.compile(r'\n+|(?<=[.!?])["\']?[^\S\n]+(?=[A-Z"\'])')
+
+
 def _extractive_summarize(text: str, sentence_count: int) -> Optional[str]:
     try:
-        raw: list[str] = []
-        for line in re.split(r"\n+", text.strip()):
-            raw.extend(re.split(r'(?<=[.!?])["\']?\s+(?=[A-Z"\'])', line))
-
-        originals: list[str] = []
+        # Sentences in document order; repeats are scored once, at first position.
         sentences: list[str] = []
-        for s in raw:
+        seen: set[str] = set()
+        for s in _SENTENCE_SPLIT_RE.split(text.strip()):
             s = s.strip()
             if len(s.split()) < 4:
                 continue
-            originals.append(s)
-            sentences.append(s if re.search(r'[.!?]["\']?\s*$', s) else s + ".")
+            # Terminated = ends in . ! or ?, optionally followed by one quote.
+            body = s[:-1] if s[-1] in "\"'" else s
+            if not body.endswith((".", "!", "?")):
+                s += "."
+            if s not in seen:
+                seen.add(s)
+                sentences.append(s)
 
         if not sentences:
             return None
 
-        words = re.findall(r"\b[a-z]+\b", text.lower())
-        word_freq = Counter(w for w in words if w not in _STOP_WORDS)
+        word_freq = Counter(
+            w for w in map(str.lower, _ALPHA_WORD_RE.findall(text)) if w not in _STOP_WORDS
+        )
         if not word_freq:
             return None
 
         max_freq = max(word_freq.values())
         normalized = {w: freq / max_freq for w, freq in word_freq.items()}
-        scores = {
-            sent: sum(normalized.get(w, 0) for w in re.findall(r"\b[a-z]+\b", sent.lower()))
+        scores = [
+            sum(normalized.get(w.lower(), 0) for w in _ALPHA_WORD_RE.findall(sent))
             for sent in sentences
-        }
+        ]
 
-        orig_by_display = dict(zip(sentences, originals))
-        top = heapq.nlargest(sentence_count, scores, key=scores.get)
-        top_ordered = sorted(top, key=lambda s: text.index(orig_by_display[s]))
-        return " ".join(top_ordered)
+        top = heapq.nlargest(sentence_count, range(len(sentences)), key=scores.__getitem__)
+        return " ".join(sentences[i] for i in sorted(top))
 
     except Exception as exc:
         logger.warning("Extractive summarizer failed: %s", exc)
@@ -279,7 +409,7 @@ def _objectivity_backup(prob: float) -> tuple[bool, str]:
 
 
 def _bias_backup(scores: dict[str, float]) -> tuple[list[str], str]:
-    clear_above = [k for k, v in scores.items() if v >= _HIGH]
+    clear_above = _categories_at_least(scores, _HIGH)
     if clear_above:
         return clear_above, (
             f"Clear bias detected: {', '.join(clear_above)}. "
@@ -297,30 +427,74 @@ def _bias_backup(scores: dict[str, float]) -> tuple[list[str], str]:
 # OpenAI — single unified call
 # ─────────────────────────────────────────────────────────────
 
+_VERDICT_PATTERNS = {
+    keyword: re.compile(rf"^{keyword}:\s*(YES|NO)\b.*$", re.IGNORECASE | re.MULTILINE)
+    for keyword in ("SCAM", "SUBJECTIVE", "BIASED")
+}
+
+
 def _extract_verdict(section_text: str, keyword: str) -> tuple:
     """Extract a YES/NO verdict from the first matching line; return (bool|None, cleaned_text)."""
-    pattern = rf"^{re.escape(keyword)}:\s*(YES|NO)\b.*$"
-    match = re.search(pattern, section_text, re.IGNORECASE | re.MULTILINE)
+    match = _VERDICT_PATTERNS[keyword].search(section_text)
     if match:
         verdict = match.group(1).upper() == "YES"
-        cleaned = re.sub(pattern, "", section_text, count=1, flags=re.IGNORECASE | re.MULTILINE).strip()
+        cleaned = (section_text[:match.start()] + section_text[match.end():]).strip()
         return verdict, cleaned
     return None, section_text
 
 
+_OPENAI_ERROR_MESSAGES: dict[type, str] = {
+    AuthenticationError: "invalid OpenAI API key",
+    RateLimitError:      "OpenAI rate limit exceeded",
+}
+
+_client: Optional[AsyncOpenAI] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared client so requests reuse its connection pool."""
+    global _client
+    if _client is None or _client.api_key != api_key:
+        _client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=_MAX_RETRIES,
+            timeout=_REQUEST_TIMEOUT,
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared OpenAI client's connection pool (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Created lazily so it binds to the running event loop."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return _semaphore
+
+
 def _parse_sections(raw: str) -> dict[str, str]:
     """Split OpenAI response by known section tags, return tag → content."""
+    # Locate every tag once, then slice each section up to the next tag found.
+    positions = [(raw.find(tag), tag) for tag in _ALL_TAGS]
     result: dict[str, str] = {}
-    for i, tag in enumerate(_ALL_TAGS):
-        start = raw.find(tag)
+    for i, (start, tag) in enumerate(positions):
         if start == -1:
             continue
         content_start = start + len(tag)
-        later = [
-            raw.find(t, content_start)
-            for t in _ALL_TAGS[i + 1:]
-            if raw.find(t, content_start) != -1
-        ]
+        later: list[int] = []
+        for pos, t in positions[i + 1:]:
+            if 0 <= pos < content_start:
+                pos = raw.find(t, content_start)
+            if pos != -1:
+                later.append(pos)
         content_end = min(later) if later else len(raw)
         text = raw[content_start:content_end].strip()
         if text:
@@ -334,11 +508,21 @@ async def _openai_analyze(
     scam_prob: float,
     subj_prob: float,
     biases_above_mid: list[str],
+    summary_only: bool = False,
 ) -> dict[str, str]:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         return {}
 
+    if summary_only:
+        prompt = (
+            f"{_TAG_SUMMARY}\n"
+            f"Summarize the text in approximately {sentence_count} sentences. "
+            "Use the exact section header shown. Return only the summary.\n\n"
+            f"TEXT:\n{text[:5000]}"
+        )
+        return await _openai_complete(api_key, prompt)
+
     bias_info = (
         f"Bias categories with some signal (score >= 0.5): {', '.join(biases_above_mid)}"
         if biases_above_mid
@@ -365,30 +549,69 @@ async def _openai_analyze(
         "Do NOT describe promotional tone or writing style — only confirmed bias types.\n\n"
         f"TEXT:\n{text[:5000]}"
     )
+    return await _openai_complete(api_key, prompt)
+
 
+async def _openai_complete(api_key: str, prompt: str) -> dict[str, str]:
     try:
-        client = AsyncOpenAI(api_key=api_key)
-        response = await client.chat.completions.create(
-            model=_MODEL,
-            temperature=0.2,
-            max_tokens=800,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a media literacy assistant. Write for a general audience. "
-                        "Use plain language. Follow the section headers exactly as given."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-        )
+        client = _get_client(api_key)
+        async with _get_semaphore():
+            response = await client.chat.completions.create(
+                model=_MODEL,
+                temperature=0.2,
+                max_tokens=800,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "You are a media literacy assistant. Write for a general audience. "
+                            "Use plain language. Follow the section headers exactly as given."
+                        ),
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+            )
         raw = (response.choices[0].message.content or "").strip()
         return _parse_sections(raw)
-    except (AuthenticationError, RateLimitError, APIError, Exception) as exc:
-        logger.warning("OpenAI unified analysis failed: %s", exc)
+    except Exception as exc:
+        reason = _OPENAI_ERROR_MESSAGES.get(type(exc), str(exc))
+        logger.warning("OpenAI unified analysis failed: %s", reason)
         return {}
 
+# ─────────────────────────────────────────────────────────────
+# CPU-bound work
+# ─────────────────────────────────────────────────────────────
+
+# Scoring and summarising get their own pool so they do not queue behind
+# blocking network calls (e.g. newspaper downloads) in the default executor.
+# The work is pure Python and holds the GIL, so the threads do not run in
+# parallel; the pool size only bounds how many requests are in progress.
+_CPU_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="analysis"
+)
+
+
+def shut_down() -> None:
+    """Stop the analysis thread pool (app shutdown)."""
+    _CPU_EXECUTOR.shutdown(cancel_futures=True)
+
+
+async def _run_cpu(func: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_CPU_EXECUTOR, func, *args)
+
+
+async def _openai_analyze_shared(cache_key: tuple[bytes, int], *args: Any) -> dict[str, str]:
+    """Concurrent requests for the same text await one OpenAI call instead of
+    each issuing their own; the cache only helps once that call finishes."""
+    task = _AI_INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_openai_analyze(*args))
+        _AI_INFLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: _AI_INFLIGHT.pop(cache_key, None))
+    # Shielded so one caller disconnecting does not cancel the others' call.
+    return await asyncio.shield(task)
+
 # ─────────────────────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────────────────────
@@ -398,17 +621,40 @@ async def analyze(text: str, sentence_count: int) -> AnalysisResult:
         raise ValueError("Text cannot be empty for analysis.")
     sentence_count = max(1, min(sentence_count, 20))
 
-    # ── 1. Heuristic scores (pure Python, no network) ──────────────────────
-    scam_prob   = _score_scam(text)
-    subj_prob   = _score_subjectivity(text)
-    bias_scores = _score_biases(text)
-    biases_above_mid = [k for k, v in bias_scores.items() if v >= 0.5]
-
-    # ── 2. Single OpenAI call ───────────────────────────────────────────────
-    ai = await _openai_analyze(text, sentence_count, scam_prob, subj_prob, biases_above_mid)
+    # ── 1. Heuristic scores (pure Python, off the event loop, memoised) ────
+    digest = content_digest(text)
+    scores = _SCORE_CACHE.get(digest)
+    if scores is None:
+        scores = await _run_cpu(_heuristic_scores, text)
+        _SCORE_CACHE.set(digest, scores)
+    scam_prob, subj_prob, bias_scores, keyword_hits = scores
+    biases_above_mid = _categories_at_least(bias_scores, 0.5)
+
+    # ── 2. Single OpenAI call (cached per text; failures are not cached) ───
+    # Clearly benign input only needs the summary; the gate is deterministic
+    # per text, so the cache key never mixes summary-only and full results.
+    clearly_benign = (
+        len(text) < _SHORTCUT_MAX_CHARS
+        and not keyword_hits
+        and scam_prob <= _SHORTCUT_MAX_SCORE
+        and subj_prob <= _SHORTCUT_MAX_SCORE
+    )
+    cache_key = (digest, sentence_count)
+    ai = _AI_CACHE.get(cache_key)
+    if ai is None:
+        ai = await _openai_analyze_shared(
+            cache_key, text, sentence_count, scam_prob, subj_prob, biases_above_mid,
+            clearly_benign,
+        )
+        if ai:
+            _AI_CACHE.set(cache_key, ai)
 
     # ── 3. Summary ──────────────────────────────────────────────────────────
-    summary = ai.get(_TAG_SUMMARY) or _extractive_summarize(text, sentence_count)
+    summary = ai.get(_TAG_SUMMARY) or _SUMMARY_CACHE.get(cache_key)
+    if not summary:
+        summary = await _run_cpu(_extractive_summarize, text, sentence_count)
+        if summary:
+            _SUMMARY_CACHE.set(cache_key, summary)
 
     # ── 4. Scam notes + verdict ─────────────────────────────────────────────
     if _TAG_SCAM in ai:
@@ -429,7 +675,8 @@ async def analyze(text: str, sentence_count: int) -> AnalysisResult:
     if _TAG_BIAS in ai:
         gpt_is_biased, bias_notes = _extract_verdict(ai[_TAG_BIAS], "BIASED")
         if gpt_is_biased is True:
-            biases = biases_above_mid or [k for k, v in bias_scores.items() if v > 0][:1]
+            top = heapq.nlargest(1, bias_scores.items(), key=itemgetter(1))
+            biases = biases_above_mid or [k for k, v in top if v > 0]
         elif gpt_is_biased is False:
             biases = []
         else:
@@ -438,8 +685,10 @@ async def analyze(text: str, sentence_count: int) -> AnalysisResult:
         biases, bias_notes = _bias_backup(bias_scores)
 
     # ── 7. AI sections for PDF last page (display name → cleaned text) ──────
+    # A summary-only call leaves the verdicts to the backup messages, so it
+    # is kept out of the AI sections and the PDF uses the fallback layout.
     cleaned_ai: dict[str, str] = {}
-    if _TAG_SUMMARY in ai:
+    if _TAG_SUMMARY in ai and not clearly_benign:
         cleaned_ai[_TAG_SUMMARY] = ai[_TAG_SUMMARY]
     if _TAG_SCAM in ai and scam_notes:
         cleaned_ai[_TAG_SCAM] = scam_notes
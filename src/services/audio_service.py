@@ -4,6 +4,7 @@ import logging
 import os
 from typing import Optional
 
+import httpx
 from elevenlabs.client import AsyncElevenLabs
 from elevenlabs.core import ApiError
 
@@ -14,6 +15,32 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"  # Rachel — clear neutral narration
 MAX_CHARS = 5_000  # ElevenLabs practical per-request limit
+_REQUEST_TIMEOUT = 240.0  # SDK default; an explicit httpx client would otherwise get 5 s
+
+
+_client: Optional[AsyncElevenLabs] = None
+_client_key: Optional[str] = None
+# The SDK exposes no close(), so the client is given an httpx client we own.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client(api_key: str) -> AsyncElevenLabs:
+    """Return the shared ElevenLabs client so requests reuse its connection pool."""
+    global _client, _client_key, _http_client
+    if _client is None or _client_key != api_key:
+        await close_client()
+        _http_client = httpx.AsyncClient(timeout=_REQUEST_TIMEOUT)
+        _client = AsyncElevenLabs(api_key=api_key, httpx_client=_http_client)
+        _client_key = api_key
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared ElevenLabs client's connection pool (app shutdown)."""
+    global _client, _client_key, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _client = _client_key = _http_client = None
 
 
 def _gtts_fallback(text: str) -> bytes:
@@ -35,7 +62,7 @@ async def generate_audio(input: str) -> tuple[bytes, ExtractionResult]:
     api_key = os.environ.get("ELEVENLABS_API_KEY")
     if api_key:
         resolved_voice = DEFAULT_VOICE_ID
-        client = AsyncElevenLabs(api_key=api_key)
+        client = await _get_client(api_key)
         try:
             audio_stream = client.text_to_speech.convert(
                 text=text,
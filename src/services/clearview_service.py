@@ -1,8 +1,17 @@
+import asyncio
+import functools
+import logging
 import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 
 from fpdf import FPDF
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -166,3 +175,59 @@ def generate_clearview(
         pdf.multi_cell(_TEXT_WIDTH, 5.5, txt=_sanitize(source), align="L")
 
     return bytes(pdf.output())
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+# fpdf2 layout is pure Python and holds the GIL for the whole render, so
+# reports are built in worker processes rather than the default thread pool.
+# Every uvicorn worker gets its own pool, and os.cpu_count() reports host
+# CPUs rather than the container quota, so keep the default small.
+_MAX_WORKERS = max(1, int(os.environ.get("CLEARVIEW_PDF_WORKERS", min(4, os.cpu_count() or 1))))
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def render_clearview(*args, **kwargs) -> bytes:
+    """Run generate_clearview in the PDF worker pool."""
+    global _executor
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    try:
+        return await loop.run_in_executor(
+            executor, functools.partial(generate_clearview, *args, **kwargs)
+        )
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next request starts a fresh one,
+        # unless a concurrent request has already replaced it.
+        if _executor is executor:
+            _executor = None
+        raise
+
+
+async def warm_up() -> None:
+    """Start one PDF worker and render a throwaway report so the first
+    request does not pay for process spawn and fpdf2 import. Meant to run
+    as a background task; the remaining workers start on demand."""
+    try:
+        await render_clearview("", "", "", 0)
+    except Exception as exc:
+        logger.warning("PDF worker warm-up failed: %s", exc)
+
+
+def shut_down() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
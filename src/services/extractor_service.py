@@ -6,6 +6,7 @@ import logging
 import os
 import re
 import tempfile
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Optional
 from urllib.parse import urlparse, urlencode, urlunparse, parse_qs
 
@@ -14,6 +15,7 @@ import pymupdf
 from newspaper import Article, Config
 
 from ..models.models import ExtractionResult
+from .cache_service import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +24,17 @@ logger = logging.getLogger(__name__)
 # Text normalization
 # ---------------------------------------------------------------------------
 
+_MULTI_SPACE_RE   = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
 def _normalize(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     text = text.replace("\t", " ")
-    text = re.sub(r" {2,}", " ", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
     lines = [line.strip() for line in text.splitlines()]
     text = "\n".join(lines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -92,12 +98,16 @@ def check_for_paywall(url: str, html: str, word_count: int):
 # URL detection
 # ---------------------------------------------------------------------------
 
+_SCHEME_RE      = re.compile(r'^https?://')
+_BARE_DOMAIN_RE = re.compile(r'^[\w.-]+\.[a-zA-Z]{2,}')
+
+
 def _is_url(text: str) -> bool:
     text = text.strip()
-    if re.match(r'^https?://', text):
+    if _SCHEME_RE.match(text):
         return True
     # No spaces + looks like a domain (e.g. "example.com/path")
-    if ' ' not in text and re.match(r'^[\w.-]+\.[a-zA-Z]{2,}', text):
+    if ' ' not in text and _BARE_DOMAIN_RE.match(text):
         return True
     return False
 
@@ -128,6 +138,10 @@ def clean_url(url: str) -> str:
     return urlunparse(cleaned)
 
 
+_WIKIPEDIA_DOMAIN_RE = re.compile(r'\.wikipedia\.org$')
+_WIKI_PATH_RE        = re.compile(r'^/wiki/(.+)$')
+
+
 def detect_url_type(url: str) -> str:
     parsed = urlparse(url)
     domain = parsed.netloc.lower().replace("www.", "")
@@ -136,7 +150,7 @@ def detect_url_type(url: str) -> str:
     if domain in ("reddit.com", "old.reddit.com", "new.reddit.com"):
         return "reddit"
 
-    if re.search(r'\.wikipedia\.org$', domain):
+    if _WIKIPEDIA_DOMAIN_RE.search(domain):
         return "wikipedia"
 
     if path.endswith(".pdf"):
@@ -172,6 +186,45 @@ def _run_newspaper(url: str, input_html: Optional[str] = None) -> tuple[str, str
     return article.html, article.title or "", article.authors or [], article.text or ""
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+# Fail fast when a host is unreachable (connect budget just over the 3 s TCP
+# retransmit window) while still allowing slow reads of large bodies.
+_CONNECT_TIMEOUT = 3.05
+
+
+def _timeout(read: float) -> httpx.Timeout:
+    return httpx.Timeout(read, connect=_CONNECT_TIMEOUT)
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared client so repeat fetches reuse pooled connections.
+    HTTP/2 lets concurrent fetches to the same host share one connection.
+    The client serves every user, so its jar rejects all cookies rather than
+    carrying one request's cookies into another's."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            http2=True,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client's connection pool (app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # ---------------------------------------------------------------------------
 # URL extractors
 # ---------------------------------------------------------------------------
@@ -185,10 +238,9 @@ async def extract_reddit(url: str) -> ExtractionResult:
     try:
         json_url = url.rstrip("/") + ".json"
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=10) as client:
-            response = await client.get(json_url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        response = await _get_http_client().get(json_url, headers=headers, timeout=_timeout(10))
+        response.raise_for_status()
+        data = response.json()
 
         post = data[0]["data"]["children"][0]["data"]
         title = post.get("title", "").strip()
@@ -223,7 +275,7 @@ async def extract_reddit(url: str) -> ExtractionResult:
 async def extract_wikipedia(url: str) -> ExtractionResult:
     parsed = urlparse(url)
     # Extract article title from path: /wiki/Article_Title
-    match = re.match(r'^/wiki/(.+)$', parsed.path)
+    match = _WIKI_PATH_RE.match(parsed.path)
     if not match:
         return ExtractionResult(
             title="", content="", source=url, input_type="url",
@@ -247,10 +299,9 @@ async def extract_wikipedia(url: str) -> ExtractionResult:
     }
 
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-            response = await client.get(api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await _get_http_client().get(api_url, params=params, timeout=_timeout(15))
+        response.raise_for_status()
+        data = response.json()
 
         pages = data.get("query", {}).get("pages", {})
         if not pages:
@@ -295,15 +346,16 @@ async def extract_wikipedia(url: str) -> ExtractionResult:
 
 async def extract_pdf_url(url: str) -> ExtractionResult:
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(response.content)
-            tmp_path = tmp.name
-
+        tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        tmp_path = tmp.name
         try:
+            # Stream the body to disk so large PDFs are never held in memory whole.
+            with tmp:
+                async with _get_http_client().stream("GET", url, timeout=_timeout(30)) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        tmp.write(chunk)
+
             doc = pymupdf.open(tmp_path)
             text = "\n".join(page.get_text() for page in doc)
             doc.close()
@@ -382,8 +434,17 @@ async def extract_generic(url: str) -> ExtractionResult:
     )
 
 
+# Successful extractions keyed by cleaned URL, so /clearview and /audio on
+# the same page (or a repeat request) skip the download.
+_URL_CACHE = LRUCache(maxsize=256, ttl=300)
+
+
 async def extract_from_url(url: str) -> ExtractionResult:
     url = clean_url(url)
+    cached = _URL_CACHE.get(url)
+    if cached is not None:
+        return cached
+
     url_type = detect_url_type(url)
 
     extractors = {
@@ -393,14 +454,17 @@ async def extract_from_url(url: str) -> ExtractionResult:
         "generic":   extract_generic,
     }
 
-    return await extractors[url_type](url)
+    result = await extractors[url_type](url)
+    if not result.error:
+        _URL_CACHE.set(url, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
 # Raw text extractor
 # ---------------------------------------------------------------------------
 
-async def extract_from_text(text: str) -> ExtractionResult:
+def extract_from_text(text: str) -> ExtractionResult:
     text = text.strip()
 
     if not text:
@@ -438,7 +502,7 @@ async def extract(input: str) -> ExtractionResult:
             f"Text exceeds maximum length of {MAX_TEXT_LENGTH} characters (~10,000 words). Please shorten the input."
         )
 
-    return await extract_from_text(inp)
+    return extract_from_text(inp)
 
 
 # ---------------------------------------------------------------------------
@@ -453,10 +517,15 @@ async def _main():
         print("Usage: python -m src.services.extractor_service <url or text>")
         return
 
-    result = await extract(" ".join(sys.argv[1:]))
-    print(json.dumps(result.model_dump(), indent=2, ensure_ascii=False))
-    print("\n--- content ---\n")
-    print(result.content)
+    try:
+        result = await extract(" ".join(sys.argv[1:]))
+    finally:
+        await close_http_client()
+    sys.stdout.write(
+        f"{json.dumps(result.model_dump(), indent=2, ensure_ascii=False)}\n"
+        f"\n--- content ---\n\n"
+        f"{result.content}\n"
+    )
 
 
 if __name__ == "__main__":